@@ -5,14 +5,23 @@ Includes: Audio processing, Hume AI integration, Omi notifications, etc.
 
 import os
 import json
-import tempfile
+import time
+import logging
+import struct
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import lru_cache
+from operator import attrgetter
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
 from hume import AsyncHumeClient
-from hume.expression_measurement.stream import StreamLanguage
+from hume.expression_measurement.stream import StreamLanguage, StreamModelsEndpointPayload
 from hume.expression_measurement.stream.stream.types import Config
+from websockets.exceptions import ConnectionClosed
+
+logger = logging.getLogger("omi")
 
 
 # ============================================================================
@@ -43,12 +52,35 @@ audio_stats = {
     "emotion_counts": {},
     "rizz_score": 75,
     "recent_notifications": [],
-    "last_notification_time": None
+    "last_notification_time": None,
+    "hume_wait_seconds": 0.0
 }
 
+# Status and results of recent /audio uploads, keyed by filename
+audio_jobs: Dict[str, Dict[str, Any]] = {}
+MAX_AUDIO_JOBS = 100
+
 # Notification cooldown in seconds (configurable)
 NOTIFICATION_COOLDOWN_SECONDS = 30
 
+# Max seconds to wait for each chunk of an uploaded audio body
+AUDIO_BODY_TIMEOUT_SECONDS = float(os.getenv('AUDIO_BODY_TIMEOUT_SECONDS', '30'))
+
+# Largest accepted /audio upload in bytes (default 50 MB, ~26 minutes of 16kHz audio)
+MAX_AUDIO_BYTES = int(os.getenv('MAX_AUDIO_BYTES', str(50 * 1024 * 1024)))
+
+# Clips whose peak 16-bit amplitude stays below this are treated as silence
+SILENCE_PEAK_THRESHOLD = int(os.getenv('SILENCE_PEAK_THRESHOLD', '64'))
+
+
+def record_audio_job(filename: str, job: Dict[str, Any]):
+    """Store the status of an upload, keeping only the most recent MAX_AUDIO_JOBS"""
+    audio_jobs.pop(filename, None)
+    audio_jobs[filename] = job
+
+    while len(audio_jobs) > MAX_AUDIO_JOBS:
+        audio_jobs.pop(next(iter(audio_jobs)))
+
 
 def can_send_notification() -> bool:
     """Check if enough time has passed since last notification"""
@@ -72,17 +104,17 @@ def load_emotion_config():
     if env_config:
         try:
             config = json.loads(env_config)
-            print(f"✓ Loaded emotion config from environment variable")
+            logger.info("✓ Loaded emotion config from environment variable")
             return config
         except json.JSONDecodeError as e:
-            print(f"Warning: Invalid EMOTION_NOTIFICATION_CONFIG JSON: {e}")
+            logger.warning(f"Invalid EMOTION_NOTIFICATION_CONFIG JSON: {e}")
 
     # Fall back to config file
     config_file = Path("emotion_config.json")
     if config_file.exists():
         with open(config_file, 'r') as f:
             config = json.load(f)
-            print(f"✓ Loaded emotion config from {config_file}")
+            logger.info(f"✓ Loaded emotion config from {config_file}")
             return config
 
     # Default configuration
@@ -91,7 +123,7 @@ def load_emotion_config():
         "emotion_thresholds": {},
         "notification_message_template": "🎭 Emotion Alert: Detected {emotions}"
     }
-    print(f"ℹ️ Using default emotion config")
+    logger.info("ℹ️ Using default emotion config")
     return default_config
 
 EMOTION_CONFIG = load_emotion_config()
@@ -140,37 +172,201 @@ def get_rizz_notification_message(score: float, emotions: list) -> str:
 # AUDIO PROCESSING FUNCTIONS
 # ============================================================================
 
-def create_wav_header(sample_rate: int, data_size: int) -> bytes:
-    """Create a WAV header for raw PCM audio data"""
-    import struct
+class AudioTooLargeError(ValueError):
+    """Raised when an uploaded audio body exceeds MAX_AUDIO_BYTES"""
+
+
+async def read_body_preallocated(request, max_bytes: int = MAX_AUDIO_BYTES) -> bytearray:
+    """Read the request body into a buffer preallocated from Content-Length
+
+    The buffer is returned as is to avoid copying it. It is shared with worker
+    threads and memoryview slices afterwards, so it must not be resized.
+
+    Raises AudioTooLargeError if the body is larger than max_bytes, and
+    asyncio.TimeoutError if a chunk takes longer than AUDIO_BODY_TIMEOUT_SECONDS.
+    """
+    try:
+        content_length = int(request.headers.get("content-length", "0"))
+    except ValueError:
+        content_length = 0
+
+    # Reject before allocating, bytearray(n) zero-fills and commits the memory
+    if content_length > max_bytes:
+        raise AudioTooLargeError(f"Audio body of {content_length} bytes exceeds {max_bytes} bytes")
+
+    # Without Content-Length (chunked uploads) the buffer grows as bytes arrive
+    buffer = bytearray(max(content_length, 0))
+    offset = 0
+    stream = request.stream()
+
+    while True:
+        try:
+            chunk = await asyncio.wait_for(anext(stream), timeout=AUDIO_BODY_TIMEOUT_SECONDS)
+        except StopAsyncIteration:
+            break
+
+        if offset + len(chunk) > max_bytes:
+            raise AudioTooLargeError(f"Audio body exceeds {max_bytes} bytes")
+
+        # Slice assignment grows the buffer past Content-Length, bounded by max_bytes above
+        buffer[offset:offset + len(chunk)] = chunk
+        offset += len(chunk)
+
+    if offset < len(buffer):
+        del buffer[offset:]
 
-    num_channels = 1
+    return buffer
+
+
+@lru_cache(maxsize=8)
+def _wav_header_template(sample_rate: int, num_channels: int) -> bytes:
+    """WAV header for a sample rate and channel count with both size fields left as zero"""
     bits_per_sample = 16
     byte_rate = sample_rate * num_channels * bits_per_sample // 8
     block_align = num_channels * bits_per_sample // 8
 
-    header = bytearray()
-    header.extend(b'RIFF')
-    header.extend(struct.pack('<I', 36 + data_size))
-    header.extend(b'WAVE')
-    header.extend(b'fmt ')
-    header.extend(struct.pack('<I', 16))
-    header.extend(struct.pack('<H', 1))
-    header.extend(struct.pack('<H', num_channels))
-    header.extend(struct.pack('<I', sample_rate))
-    header.extend(struct.pack('<I', byte_rate))
-    header.extend(struct.pack('<H', block_align))
-    header.extend(struct.pack('<H', bits_per_sample))
-    header.extend(b'data')
-    header.extend(struct.pack('<I', data_size))
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 0, b'WAVE',
+        b'fmt ', 16, 1, num_channels, sample_rate, byte_rate,
+        block_align, bits_per_sample,
+        b'data', 0
+    )
+
 
+def create_wav_header(sample_rate: int, data_size: int, num_channels: int = 1) -> bytes:
+    """Create a WAV header for raw 16-bit PCM audio data"""
+    header = bytearray(_wav_header_template(sample_rate, num_channels))
+    struct.pack_into('<I', header, 4, 36 + data_size)
+    struct.pack_into('<I', header, 40, data_size)
     return bytes(header)
 
 
+def interleave_i16(left: bytes, right: bytes) -> bytes:
+    """Interleave two 16-bit little-endian mono channels into stereo PCM (L, R, L, R, ...)"""
+    import numpy as np
+
+    left_samples = np.frombuffer(left, dtype='<i2')
+    right_samples = np.frombuffer(right, dtype='<i2')
+
+    if left_samples.size != right_samples.size:
+        raise ValueError("Left and right channels must have the same number of samples")
+
+    stereo = np.empty(left_samples.size * 2, dtype='<i2')
+    stereo[0::2] = left_samples
+    stereo[1::2] = right_samples
+    return stereo.tobytes()
+
+
+def audio_peak_abs(pcm: bytes) -> int:
+    """Peak absolute amplitude of 16-bit little-endian PCM"""
+    import numpy as np
+
+    samples = np.frombuffer(pcm, dtype='<i2', count=len(pcm) // 2)
+    if samples.size == 0:
+        return 0
+
+    # Compare max and -min as Python ints, np.abs overflows on -32768
+    return max(int(samples.max()), -int(samples.min()))
+
+
+def is_silent(pcm: bytes, threshold: int = SILENCE_PEAK_THRESHOLD) -> bool:
+    """Check whether a PCM clip never rises above the silence threshold"""
+    return audio_peak_abs(pcm) < threshold
+
+
+def _writev_all(fd: int, buffers: List[memoryview]):
+    """Write every buffer with os.writev, resuming after short writes"""
+    while buffers:
+        written = os.writev(fd, buffers)
+        while buffers and written >= len(buffers[0]):
+            written -= len(buffers[0])
+            buffers.pop(0)
+        if buffers:
+            buffers[0] = buffers[0][written:]
+
+
+def _write_all(fd: int, buffer: memoryview):
+    """Write a whole buffer with os.write, resuming after short writes"""
+    while buffer:
+        buffer = buffer[os.write(fd, buffer):]
+
+
+def save_audio_file(file_path: Path, wav_header: bytes, audio_data: bytes):
+    """Write a WAV file to disk (blocking, run it off the event loop)
+
+    Data goes to a .part file that is renamed into place once complete, so
+    the cleanup task and readers never see a partially written WAV.
+    """
+    part_path = file_path.with_name(file_path.name + '.part')
+
+    fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            if hasattr(os, "writev"):
+                # One vectored syscall for header + audio, bypassing Python's buffered file copy
+                _writev_all(fd, [memoryview(wav_header), memoryview(audio_data)])
+            else:
+                # os.writev is Unix-only, write the two parts separately elsewhere
+                _write_all(fd, memoryview(wav_header))
+                _write_all(fd, memoryview(audio_data))
+        finally:
+            os.close(fd)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    os.replace(part_path, file_path)
+
+
+def save_audio_result(file_path: Path, job: Dict[str, Any]):
+    """Write analysis results next to the WAV as <filename>.hume.json (blocking)"""
+    import orjson
+
+    result_path = file_path.with_name(file_path.name + '.hume.json')
+    part_path = result_path.with_name(result_path.name + '.part')
+    part_path.write_bytes(orjson.dumps(job))
+    os.replace(part_path, result_path)
+
+
+def load_audio_result(audio_dir: Path, filename: str) -> Optional[Dict[str, Any]]:
+    """Load analysis results saved by save_audio_result, or None if there are none"""
+    import orjson
+
+    result_path = audio_dir / (Path(filename).name + '.hume.json')
+    try:
+        return orjson.loads(result_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except orjson.JSONDecodeError as e:
+        logger.warning(f"Ignoring unreadable analysis result {result_path.name}: {e}")
+        return None
+
+
+def delete_old_audio_files(audio_dir: Path, max_age_seconds: float = 300) -> int:
+    """Delete WAV files and their results older than max_age_seconds (blocking)"""
+    current_time = datetime.now()
+    deleted_count = 0
+
+    # Also matches .wav.hume.json results and .wav.part files left by interrupted writes
+    for audio_file in audio_dir.glob("*.wav*"):
+        try:
+            file_age = current_time - datetime.fromtimestamp(audio_file.stat().st_mtime)
+
+            if file_age.total_seconds() > max_age_seconds:
+                audio_file.unlink(missing_ok=True)
+                deleted_count += 1
+
+        except FileNotFoundError:
+            continue  # Already removed by another worker's sweep
+        except Exception as e:
+            logger.error(f"Error deleting {audio_file}: {e}")
+
+    return deleted_count
+
+
 async def cleanup_old_audio_files():
     """Background task to clean up old audio files every minute"""
-    import asyncio
-
     while True:
         try:
             await asyncio.sleep(60)
@@ -179,25 +375,14 @@ async def cleanup_old_audio_files():
             if not audio_dir.exists():
                 continue
 
-            current_time = datetime.now()
-            deleted_count = 0
-
-            for audio_file in audio_dir.glob("*.wav"):
-                try:
-                    file_age = current_time - datetime.fromtimestamp(audio_file.stat().st_mtime)
-
-                    if file_age.total_seconds() > 300:
-                        audio_file.unlink()
-                        deleted_count += 1
-
-                except Exception as e:
-                    print(f"Error deleting {audio_file}: {e}")
+            # Directory scan and unlinks are blocking syscalls, keep them off the event loop
+            deleted_count = await asyncio.to_thread(delete_old_audio_files, audio_dir)
 
             if deleted_count > 0:
-                print(f"🗑️ Cleaned up {deleted_count} old audio files")
+                logger.info(f"🗑️ Cleaned up {deleted_count} old audio files")
 
         except Exception as e:
-            print(f"Error in cleanup task: {e}")
+            logger.error(f"Error in cleanup task: {e}")
             await asyncio.sleep(60)
 
 
@@ -205,6 +390,33 @@ async def cleanup_old_audio_files():
 # OMI INTEGRATION FUNCTIONS
 # ============================================================================
 
+# Shared HTTP client for the Omi API (created lazily, closed on shutdown)
+_omi_http_client = None
+
+
+def get_omi_http_client():
+    """Get the shared httpx client so Omi calls reuse pooled keep-alive connections"""
+    import httpx
+    global _omi_http_client
+
+    if _omi_http_client is None:
+        _omi_http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=16)
+        )
+
+    return _omi_http_client
+
+
+async def close_omi_http_client():
+    """Close the shared Omi HTTP client if it was created"""
+    global _omi_http_client
+
+    if _omi_http_client is not None:
+        await _omi_http_client.aclose()
+        _omi_http_client = None
+
+
 async def send_omi_notification(
     uid: str,
     message: str,
@@ -212,7 +424,6 @@ async def send_omi_notification(
     api_key: Optional[str] = None
 ) -> Dict[str, Any]:
     """Send notification to Omi mobile app"""
-    import httpx
     from urllib.parse import quote
 
     app_id = app_id or os.getenv('OMI_APP_ID')
@@ -233,20 +444,20 @@ async def send_omi_notification(
             "Content-Length": "0"
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, timeout=30.0)
+        client = get_omi_http_client()
+        response = await client.post(url, headers=headers, timeout=30.0)
 
         if response.status_code >= 200 and response.status_code < 300:
-            print(f"✓ Sent Omi notification to user {uid}: {message}")
+            logger.info(f"✓ Sent Omi notification to user {uid}: {message}")
             return {"success": True, "message": message}
         else:
             error_msg = f"Omi API error: {response.status_code} - {response.text}"
-            print(f"✗ {error_msg}")
+            logger.error(f"✗ {error_msg}")
             return {"success": False, "error": error_msg}
 
     except Exception as e:
         error_msg = f"Failed to send Omi notification: {str(e)}"
-        print(f"✗ {error_msg}")
+        logger.error(f"✗ {error_msg}")
         return {"success": False, "error": error_msg}
 
 
@@ -258,8 +469,6 @@ async def create_omi_memory(
     api_key: Optional[str] = None
 ) -> Dict[str, Any]:
     """Create a memory in Omi app"""
-    import httpx
-
     app_id = app_id or os.getenv('OMI_APP_ID')
     api_key = api_key or os.getenv('OMI_API_KEY')
 
@@ -285,20 +494,20 @@ async def create_omi_memory(
         if emotions:
             payload["emotions"] = emotions
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=payload, timeout=30.0)
+        client = get_omi_http_client()
+        response = await client.post(url, headers=headers, json=payload, timeout=30.0)
 
         if response.status_code >= 200 and response.status_code < 300:
-            print(f"✓ Created Omi memory for user {uid}")
+            logger.info(f"✓ Created Omi memory for user {uid}")
             return {"success": True, "memory": text}
         else:
             error_msg = f"Omi API error: {response.status_code} - {response.text}"
-            print(f"✗ {error_msg}")
+            logger.error(f"✗ {error_msg}")
             return {"success": False, "error": error_msg}
 
     except Exception as e:
         error_msg = f"Failed to create Omi memory: {str(e)}"
-        print(f"✗ {error_msg}")
+        logger.error(f"✗ {error_msg}")
         return {"success": False, "error": error_msg}
 
 
@@ -356,7 +565,7 @@ async def save_emotion_memory(uid: Optional[str] = None):
     target_uid = uid or audio_stats.get("last_uid")
 
     if not target_uid:
-        print("⚠️ No user ID available for emotion memory")
+        logger.warning("⚠️ No user ID available for emotion memory")
         return {
             "success": False,
             "error": "No user ID available"
@@ -365,7 +574,7 @@ async def save_emotion_memory(uid: Optional[str] = None):
     summary = generate_emotion_summary()
 
     if not summary["success"]:
-        print(f"⚠️ Cannot create memory: {summary['error']}")
+        logger.warning(f"⚠️ Cannot create memory: {summary['error']}")
         return summary
 
     result = await create_omi_memory(
@@ -379,23 +588,21 @@ async def save_emotion_memory(uid: Optional[str] = None):
 
 async def emotion_memory_background_task():
     """Background task that saves emotion summaries every hour"""
-    import asyncio
-
     while True:
         try:
             await asyncio.sleep(3600)
 
             if audio_stats.get("last_uid") and audio_stats["emotion_counts"]:
-                print("💾 Auto-saving emotion memory (hourly task)...")
+                logger.info("💾 Auto-saving emotion memory (hourly task)...")
                 result = await save_emotion_memory()
 
                 if result.get("success"):
-                    print("✓ Hourly emotion memory saved")
+                    logger.info("✓ Hourly emotion memory saved")
                 else:
-                    print(f"✗ Failed to save hourly memory: {result.get('error')}")
+                    logger.error(f"✗ Failed to save hourly memory: {result.get('error')}")
 
         except Exception as e:
-            print(f"Error in emotion memory background task: {e}")
+            logger.error(f"Error in emotion memory background task: {e}")
             await asyncio.sleep(3600)
 
 
@@ -403,6 +610,18 @@ async def emotion_memory_background_task():
 # EMOTION DETECTION FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=64)
+def parse_emotion_filters(emotion_filters: str) -> Dict[str, float]:
+    """Parse an emotion_filters JSON string (cached, devices resend the same value every request)
+
+    The returned dict is shared between calls and must not be mutated.
+    Raises json.JSONDecodeError on invalid JSON.
+    """
+    import orjson
+
+    return orjson.loads(emotion_filters)
+
+
 def check_emotion_triggers(
     predictions: List[Dict[str, Any]],
     emotion_thresholds: Optional[Dict[str, float]] = None
@@ -445,6 +664,140 @@ def check_emotion_triggers(
 # HUME AI INTEGRATION FUNCTIONS
 # ============================================================================
 
+def _positive_int_env(name: str, default: int) -> int:
+    """Read an integer setting that must be at least 1, failing at startup otherwise"""
+    value = int(os.getenv(name, str(default)))
+    if value < 1:
+        raise ValueError(f"{name} must be at least 1, got {value}")
+    return value
+
+
+# Number of idle Hume stream sockets kept open between requests
+HUME_SOCKET_POOL_SIZE = _positive_int_env('HUME_SOCKET_POOL_SIZE', 4)
+
+# Max Hume calls in flight at once, beyond this Hume starts dropping connections
+HUME_MAX_CONCURRENCY = _positive_int_env('HUME_MAX_CONCURRENCY', 4)
+
+
+class HumeSocketPool:
+    """Shared Hume client plus a pool of warm stream WebSockets.
+
+    Opening a stream socket costs a TLS handshake and auth round-trip, which
+    dominates for short clips. Sockets are handed out exclusively and every
+    payload resets the stream context; when the pool is empty a new socket is
+    opened, and at most `size` idle sockets are kept.
+
+    At most `max_concurrency` Hume calls run at once. Further calls wait for a
+    slot, and the time spent waiting is added to audio_stats["hume_wait_seconds"].
+    """
+
+    def __init__(self, size: int, max_concurrency: int):
+        self.size = size
+        self._client = None
+        self._api_key = None
+        self._idle = asyncio.Queue(maxsize=size)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._closed = False
+
+    def get_client(self, api_key: str) -> AsyncHumeClient:
+        """Get the shared Hume client, rebuilding it if the API key changed"""
+        if self._client is None or self._api_key != api_key:
+            self._client = AsyncHumeClient(api_key=api_key)
+            self._api_key = api_key
+        return self._client
+
+    async def _open(self, api_key: str) -> Tuple[AsyncExitStack, Any]:
+        stack = AsyncExitStack()
+        socket = await stack.enter_async_context(
+            self.get_client(api_key).expression_measurement.stream.connect()
+        )
+        return stack, socket
+
+    async def _discard(self, conn: Tuple[AsyncExitStack, Any]):
+        try:
+            await conn[0].aclose()
+        except Exception:
+            pass
+
+    async def _release(self, conn: Tuple[AsyncExitStack, Any]):
+        # After close() nothing is pooled again, late sockets are closed instead
+        if self._closed:
+            await self._discard(conn)
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except asyncio.QueueFull:
+            await self._discard(conn)
+
+    def _take_idle(self) -> Optional[Tuple[AsyncExitStack, Any]]:
+        try:
+            return self._idle.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one of the concurrent Hume call slots"""
+        wait_start = time.perf_counter()
+        async with self._semaphore:
+            audio_stats["hume_wait_seconds"] += time.perf_counter() - wait_start
+            yield
+
+    async def send_file(self, api_key: str, data: str, config: Config):
+        """Send a base64 payload on a pooled socket, reconnecting once if it went stale"""
+        async with self.slot():
+            return await self._send_file(api_key, data, config)
+
+    async def _send_file(self, api_key: str, data: str, config: Config):
+        conn = self._take_idle()
+
+        if conn is not None:
+            try:
+                return await self._send_on(conn, data, config)
+            except ConnectionClosed:
+                pass  # Idle socket was closed server-side, retry on a fresh one
+
+        return await self._send_on(await self._open(api_key), data, config)
+
+    async def _send_on(self, conn: Tuple[AsyncExitStack, Any], data: str, config: Config):
+        """Send on a borrowed socket, then return it to the pool"""
+        # reset_stream drops context left by the previous request (possibly another
+        # uid) in the same message as the data, saving a separate reset round trip
+        payload = StreamModelsEndpointPayload(data=data, models=config, reset_stream=True)
+        try:
+            await conn[1].send_publish(payload)
+            result = await conn[1].recv()
+        except BaseException:
+            # Includes cancellation, the socket is never handed back in an unknown state
+            await self._discard(conn)
+            raise
+
+        await self._release(conn)
+        return result
+
+    async def warm_up(self, api_key: str):
+        """Pre-open idle sockets so the first requests skip the handshake"""
+        self.get_client(api_key)
+        while not self._closed and not self._idle.full():
+            try:
+                conn = await self._open(api_key)
+            except Exception as e:
+                logger.warning(f"Failed to pre-open Hume socket: {e}")
+                return
+            await self._release(conn)
+
+        logger.info(f"✓ Opened {self._idle.qsize()} Hume stream sockets")
+
+    async def close(self):
+        """Close all idle sockets and stop pooling sockets returned later"""
+        self._closed = True
+        while not self._idle.empty():
+            await self._discard(self._idle.get_nowait())
+
+
+hume_socket_pool = HumeSocketPool(HUME_SOCKET_POOL_SIZE, HUME_MAX_CONCURRENCY)
+
+
 async def analyze_text_with_hume(text: str) -> Dict[str, Any]:
     """Analyze text emotion using Hume AI Language model"""
     hume_api_key = os.getenv('HUME_API_KEY')
@@ -456,12 +809,12 @@ async def analyze_text_with_hume(text: str) -> Dict[str, Any]:
         }
 
     try:
-        print(f"Analyzing text with Hume AI (length: {len(text)} chars)")
+        logger.info(f"Analyzing text with Hume AI (length: {len(text)} chars)")
 
-        client = AsyncHumeClient(api_key=hume_api_key)
+        client = hume_socket_pool.get_client(hume_api_key)
         model_config = Config(language=StreamLanguage())
 
-        async with client.expression_measurement.stream.connect() as socket:
+        async with hume_socket_pool.slot(), client.expression_measurement.stream.connect() as socket:
             result = await socket.send_text(text, config=model_config)
 
             if hasattr(result, 'error'):
@@ -479,7 +832,7 @@ async def analyze_text_with_hume(text: str) -> Dict[str, Any]:
                     if hasattr(pred, 'emotions'):
                         emotions = [
                             {"name": e.name, "score": e.score}
-                            for e in sorted(pred.emotions, key=lambda x: x.score, reverse=True)
+                            for e in sorted(pred.emotions, key=attrgetter('score'), reverse=True)
                         ]
 
                     predictions.append({
@@ -488,7 +841,7 @@ async def analyze_text_with_hume(text: str) -> Dict[str, Any]:
                         "top_3_emotions": emotions[:3]
                     })
 
-            print(f"✓ Hume text analysis complete: {len(predictions)} predictions")
+            logger.info(f"✓ Hume text analysis complete: {len(predictions)} predictions")
 
             return {
                 "success": True,
@@ -497,9 +850,7 @@ async def analyze_text_with_hume(text: str) -> Dict[str, Any]:
             }
 
     except Exception as e:
-        print(f"✗ Hume text analysis failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"✗ Hume text analysis failed: {e}")
 
         return {
             "success": False,
@@ -508,10 +859,8 @@ async def analyze_text_with_hume(text: str) -> Dict[str, Any]:
         }
 
 
-async def analyze_audio_with_hume(wav_file_path: str) -> Dict[str, Any]:
-    """Analyze audio emotion using Hume AI Prosody model with automatic chunking"""
-    import wave
-
+async def analyze_audio_with_hume(audio_data: bytes, sample_rate: int) -> Dict[str, Any]:
+    """Analyze raw 16-bit mono PCM using Hume AI Prosody model with automatic chunking"""
     hume_api_key = os.getenv('HUME_API_KEY')
     if not hume_api_key:
         return {
@@ -521,74 +870,51 @@ async def analyze_audio_with_hume(wav_file_path: str) -> Dict[str, Any]:
         }
 
     try:
-        with wave.open(wav_file_path, 'rb') as wav_file:
-            frames = wav_file.getnframes()
-            rate = wav_file.getframerate()
-            duration = frames / float(rate)
+        bytes_per_frame = 2
+        pcm = memoryview(audio_data)[:len(audio_data) - len(audio_data) % bytes_per_frame]
+        duration = len(pcm) / float(sample_rate * bytes_per_frame)
 
-        print(f"Audio duration: {duration:.2f} seconds")
+        logger.info(f"Audio duration: {duration:.2f} seconds")
 
         MAX_DURATION = 5.0
         CHUNK_DURATION = 4.5
 
         if duration <= MAX_DURATION:
-            return await _analyze_single_audio(wav_file_path, hume_api_key)
-
-        print(f"Audio exceeds {MAX_DURATION}s limit, chunking into {CHUNK_DURATION}s segments...")
-
-        import wave
-        import struct
+            return await _analyze_single_audio(pcm, sample_rate, hume_api_key)
 
-        with wave.open(wav_file_path, 'rb') as wav_file:
-            params = wav_file.getparams()
-            frames_per_chunk = int(params.framerate * CHUNK_DURATION)
-            total_frames = wav_file.getnframes()
+        logger.info(f"Audio exceeds {MAX_DURATION}s limit, chunking into {CHUNK_DURATION}s segments...")
 
-            all_predictions = []
-            chunk_index = 0
+        # Chunks are zero-copy slices of the request buffer
+        bytes_per_chunk = int(sample_rate * CHUNK_DURATION) * bytes_per_frame
 
-            while wav_file.tell() < total_frames:
-                chunk_frames = wav_file.readframes(frames_per_chunk)
+        all_predictions = []
+        chunk_index = 0
 
-                if not chunk_frames:
-                    break
+        for offset in range(0, len(pcm), bytes_per_chunk):
+            chunk_result = await _analyze_single_audio(
+                pcm[offset:offset + bytes_per_chunk], sample_rate, hume_api_key
+            )
 
-                chunk_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-                chunk_path = chunk_file.name
-                chunk_file.close()
+            if chunk_result.get("success"):
+                for pred in chunk_result.get("predictions", []):
+                    pred["chunk_index"] = chunk_index
+                    all_predictions.append(pred)
 
-                try:
-                    with wave.open(chunk_path, 'wb') as chunk_wav:
-                        chunk_wav.setparams(params)
-                        chunk_wav.writeframes(chunk_frames)
+            chunk_index += 1
 
-                    chunk_result = await _analyze_single_audio(chunk_path, hume_api_key)
+        logger.info(f"✓ Analyzed {chunk_index} chunks, {len(all_predictions)} total predictions")
 
-                    if chunk_result.get("success"):
-                        for pred in chunk_result.get("predictions", []):
-                            pred["chunk_index"] = chunk_index
-                            all_predictions.append(pred)
-
-                finally:
-                    Path(chunk_path).unlink(missing_ok=True)
-
-                chunk_index += 1
-
-            print(f"✓ Analyzed {chunk_index} chunks, {len(all_predictions)} total predictions")
-
-            return {
-                "success": True,
-                "chunked": True,
-                "num_chunks": chunk_index,
-                "total_duration_seconds": duration,
-                "total_predictions": len(all_predictions),
-                "predictions": all_predictions
-            }
+        return {
+            "success": True,
+            "chunked": True,
+            "num_chunks": chunk_index,
+            "total_duration_seconds": duration,
+            "total_predictions": len(all_predictions),
+            "predictions": all_predictions
+        }
 
     except Exception as e:
-        print(f"✗ Audio chunking failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"✗ Audio chunking failed: {e}")
 
         return {
             "success": False,
@@ -597,49 +923,55 @@ async def analyze_audio_with_hume(wav_file_path: str) -> Dict[str, Any]:
         }
 
 
-async def _analyze_single_audio(wav_file_path: str, hume_api_key: str) -> Dict[str, Any]:
-    """Analyze a single audio file (≤5 seconds) with Hume AI"""
+async def _analyze_single_audio(pcm: memoryview, sample_rate: int, hume_api_key: str) -> Dict[str, Any]:
+    """Analyze a single PCM clip (≤5 seconds) with Hume AI"""
+    import base64
+
     try:
-        client = AsyncHumeClient(api_key=hume_api_key)
         model_config = Config(prosody={})
+        wav_data = b"".join((create_wav_header(sample_rate, len(pcm)), pcm))
 
-        async with client.expression_measurement.stream.connect() as socket:
-            result = await socket.send_file(wav_file_path, config=model_config)
+        # send_file accepts a base64 payload in place of a path, so no temp file is needed
+        result = await hume_socket_pool.send_file(
+            hume_api_key,
+            base64.b64encode(wav_data).decode(),
+            model_config
+        )
 
-            if hasattr(result, 'error'):
-                return {
-                    "success": False,
-                    "error": f"Hume API error: {result.error}",
-                    "predictions": []
-                }
+        if hasattr(result, 'error'):
+            return {
+                "success": False,
+                "error": f"Hume API error: {result.error}",
+                "predictions": []
+            }
 
-            predictions = []
+        predictions = []
 
-            if hasattr(result, 'prosody') and result.prosody and result.prosody.predictions:
-                for pred in result.prosody.predictions:
-                    emotions = []
-                    if hasattr(pred, 'emotions'):
-                        emotions = [
-                            {"name": e.name, "score": e.score}
-                            for e in sorted(pred.emotions, key=lambda x: x.score, reverse=True)
-                        ]
+        if hasattr(result, 'prosody') and result.prosody and result.prosody.predictions:
+            for pred in result.prosody.predictions:
+                emotions = []
+                if hasattr(pred, 'emotions'):
+                    emotions = [
+                        {"name": e.name, "score": e.score}
+                        for e in sorted(pred.emotions, key=attrgetter('score'), reverse=True)
+                    ]
 
-                    time_info = {
-                        "begin": pred.time.begin if hasattr(pred, 'time') else 0,
-                        "end": pred.time.end if hasattr(pred, 'time') else 0
-                    }
+                time_info = {
+                    "begin": pred.time.begin if hasattr(pred, 'time') else 0,
+                    "end": pred.time.end if hasattr(pred, 'time') else 0
+                }
 
-                    predictions.append({
-                        "time": time_info,
-                        "emotions": emotions,
-                        "top_3_emotions": emotions[:3]
-                    })
+                predictions.append({
+                    "time": time_info,
+                    "emotions": emotions,
+                    "top_3_emotions": emotions[:3]
+                })
 
-            return {
-                "success": True,
-                "total_predictions": len(predictions),
-                "predictions": predictions
-            }
+        return {
+            "success": True,
+            "total_predictions": len(predictions),
+            "predictions": predictions
+        }
 
     except Exception as e:
         return {
@@ -647,3 +979,152 @@ async def _analyze_single_audio(wav_file_path: str, hume_api_key: str) -> Dict[s
             "error": str(e),
             "predictions": []
         }
+
+
+# ============================================================================
+# AUDIO ANALYSIS PIPELINE
+# ============================================================================
+
+async def process_audio_analysis(
+    filename: str,
+    local_file_path: Path,
+    audio_data: bytes,
+    sample_rate: int,
+    uid: str,
+    analyze_emotion: bool = True,
+    send_notification: Optional[bool] = None,
+    emotion_filters: Optional[str] = None
+):
+    """Save an uploaded clip, analyze it with Hume AI and send notifications
+
+    Runs as a background task after /audio has responded. The outcome is
+    kept in audio_jobs and saved as <filename>.hume.json for polling.
+    """
+    try:
+        # Save the local copy and run Hume AI concurrently. The header is written
+        # separately so the audio buffer is never copied into a joined WAV.
+        wav_header = create_wav_header(sample_rate, len(audio_data))
+        tasks = [asyncio.to_thread(save_audio_file, local_file_path, wav_header, audio_data)]
+
+        # Why Hume analysis did not run, reported to clients polling the job
+        skipped = None
+
+        if not analyze_emotion:
+            skipped = "disabled"
+        else:
+            hume_api_key = os.getenv('HUME_API_KEY')
+            if not hume_api_key:
+                logger.warning("HUME_API_KEY not set, skipping emotion analysis")
+                skipped = "hume_not_configured"
+            elif is_silent(audio_data):
+                logger.info("Audio is silent, skipping emotion analysis")
+                skipped = "silent"
+            else:
+                logger.info("Analyzing audio with Hume AI...")
+                tasks.append(analyze_audio_with_hume(audio_data, sample_rate))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        saved = not isinstance(results[0], Exception)
+        if saved:
+            logger.info(f"Saved audio file: {local_file_path}")
+        else:
+            logger.warning(f"Failed to save audio file {local_file_path}: {results[0]}")
+
+        hume_results = results[1] if len(results) > 1 else None
+        if isinstance(hume_results, Exception):
+            logger.error(f"✗ Hume audio analysis failed: {hume_results}")
+            hume_results = {
+                "success": False,
+                "error": str(hume_results),
+                "predictions": []
+            }
+
+        if hume_results is not None:
+            if hume_results.get("success"):
+                audio_stats["successful_analyses"] += 1
+
+                predictions = hume_results.get("predictions", [])
+                all_top_emotions = []
+
+                for pred in predictions:
+                    top_3 = pred.get("top_3_emotions", [])
+                    all_top_emotions.extend(top_3)
+
+                    for emotion in top_3:
+                        emotion_name = emotion.get("name")
+                        if emotion_name:
+                            audio_stats["emotion_counts"][emotion_name] = \
+                                audio_stats["emotion_counts"].get(emotion_name, 0) + 1
+
+                if all_top_emotions:
+                    audio_stats["recent_emotions"] = all_top_emotions[:10]
+                    update_rizz_score(all_top_emotions)
+
+                # Check if should send notification
+                should_notify = send_notification if send_notification is not None else EMOTION_CONFIG.get("notification_enabled", True)
+                has_predictions = len(predictions) > 0
+
+                logger.info(f"🔔 Notification check: should_notify={should_notify}, has_predictions={has_predictions}")
+
+                if should_notify and has_predictions:
+                    # Use custom filters if provided, otherwise use config
+                    if emotion_filters:
+                        try:
+                            custom_filters = parse_emotion_filters(emotion_filters)
+                            logger.info(f"Using custom emotion filters: {custom_filters}")
+                        except json.JSONDecodeError:
+                            logger.warning("Invalid emotion_filters JSON, using config default")
+                            custom_filters = EMOTION_CONFIG.get("emotion_thresholds", {})
+                    else:
+                        custom_filters = EMOTION_CONFIG.get("emotion_thresholds", {})
+                        logger.info(f"Using config emotion filters: {custom_filters}")
+
+                    # Check trigger conditions
+                    trigger_result = check_emotion_triggers(predictions, custom_filters)
+                    logger.info(f"📊 Trigger check result: triggered={trigger_result['triggered']}, count={trigger_result['count']}")
+
+                    if trigger_result["triggered"]:
+                        triggered_emotions = trigger_result["emotions"]
+                        emotion_names = [e["name"] for e in triggered_emotions[:3]]
+
+                        # Check cooldown before sending notification
+                        if can_send_notification():
+                            message = get_rizz_notification_message(audio_stats["rizz_score"], triggered_emotions)
+
+                            notification_result = await send_omi_notification(uid, message)
+
+                            if notification_result.get("success"):
+                                update_notification_time()
+                                audio_stats["recent_notifications"].append({
+                                    "uid": uid,
+                                    "emotions": emotion_names,
+                                    "timestamp": datetime.utcnow().isoformat()
+                                })
+                                audio_stats["recent_notifications"] = audio_stats["recent_notifications"][-10:]
+                        else:
+                            logger.info("⏳ Notification cooldown active. Skipping notification.")
+
+            else:
+                audio_stats["failed_analyses"] += 1
+
+        job = {"status": "complete", "filename": filename, "uid": uid}
+        if saved:
+            # Only reported once the WAV is actually on disk
+            job["local_file_path"] = str(local_file_path.absolute())
+        if hume_results:
+            job["hume_analysis"] = hume_results
+        if skipped:
+            job["skipped"] = skipped
+
+    except Exception as e:
+        logger.exception(f"Error processing audio {filename}: {e}")
+
+        job = {"status": "failed", "filename": filename, "uid": uid, "error": str(e)}
+
+    record_audio_job(filename, job)
+
+    try:
+        await asyncio.to_thread(save_audio_result, local_file_path, job)
+    except Exception as e:
+        logger.warning(f"Failed to save analysis results for {filename}: {e}")
@@ -4,7 +4,13 @@ Main file with API endpoints only. Helper functions are in app.py
 """
 
 import os
-import tempfile
+import time
+import atexit
+import queue
+import asyncio
+import logging
+import logging.handlers
+import secrets
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
@@ -13,9 +19,25 @@ from pathlib import Path
 from dotenv import load_dotenv
 load_dotenv()
 
+# Configure logging before app.py is imported. Messages are still formatted on
+# the request path, only the stream write moves to a listener thread that lives
+# as long as the process. Only the app's own logger emits INFO; httpx request
+# lines carry uids. Uvicorn workers import this file twice (as __mp_main__ and
+# as main), so skip the setup if a QueueHandler is already installed.
+if not any(isinstance(h, logging.handlers.QueueHandler) for h in logging.getLogger().handlers):
+    log_queue = queue.SimpleQueue()
+    log_stream_handler = logging.StreamHandler()
+    log_stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    log_listener = logging.handlers.QueueListener(log_queue, log_stream_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+logger = logging.getLogger("omi")
+logger.setLevel(logging.INFO)
+
 # FastAPI imports
-from fastapi import FastAPI, Request, Query, HTTPException
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi import FastAPI, Request, Query, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse, HTMLResponse
 from fastapi.templating import Jinja2Templates
 import uvicorn
 
@@ -23,42 +45,49 @@ import uvicorn
 from app import (
     # Config and globals
     audio_stats,
+    audio_jobs,
     EMOTION_CONFIG,
     load_emotion_config,
 
     # Rizz functions
-    update_rizz_score,
     get_rizz_status_text,
     get_rizz_notification_message,
-    can_send_notification,
     update_notification_time,
     NOTIFICATION_COOLDOWN_SECONDS,
 
     # Audio processing
-    create_wav_header,
+    AudioTooLargeError,
+    read_body_preallocated,
     cleanup_old_audio_files,
+    record_audio_job,
+    load_audio_result,
+    process_audio_analysis,
 
     # Omi integration
+    close_omi_http_client,
     send_omi_notification,
     create_omi_memory,
     save_emotion_memory,
     emotion_memory_background_task,
     generate_emotion_summary,
 
-    # Emotion detection
-    check_emotion_triggers,
-
     # Hume AI
+    hume_socket_pool,
     analyze_text_with_hume,
-    analyze_audio_with_hume,
 )
 
 # Initialize FastAPI app
-app = FastAPI(title="Omi Audio Streaming Service with Hume AI")
+app = FastAPI(
+    title="Omi Audio Streaming Service with Hume AI",
+    default_response_class=ORJSONResponse
+)
 
 # Initialize Jinja2 templates
 templates = Jinja2Templates(directory="templates")
 
+# Hume socket warm-up, kept so shutdown can cancel it mid-handshake
+hume_warm_up_task: Optional[asyncio.Task] = None
+
 
 # ============================================================================
 # STARTUP EVENT
@@ -67,23 +96,43 @@ templates = Jinja2Templates(directory="templates")
 @app.on_event("startup")
 async def startup_event():
     """Initialize background tasks on server startup"""
-    import asyncio
-
-    print("🚀 Starting emotion memory background task (runs every 1 hour)...")
+    logger.info("🚀 Starting emotion memory background task (runs every 1 hour)...")
     asyncio.create_task(emotion_memory_background_task())
 
-    print("🗑️  Starting audio file cleanup task (runs every 1 minute)...")
+    logger.info("🗑️  Starting audio file cleanup task (runs every 1 minute)...")
     asyncio.create_task(cleanup_old_audio_files())
 
+    global hume_warm_up_task
+
+    hume_api_key = os.getenv('HUME_API_KEY')
+    if hume_api_key:
+        logger.info("🔌 Pre-opening Hume stream sockets...")
+        hume_warm_up_task = asyncio.create_task(hume_socket_pool.warm_up(hume_api_key))
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared connections on server shutdown"""
+    if hume_warm_up_task is not None and not hume_warm_up_task.done():
+        hume_warm_up_task.cancel()
+        try:
+            await hume_warm_up_task
+        except asyncio.CancelledError:
+            pass
+
+    await close_omi_http_client()
+    await hume_socket_pool.close()
+
 
 # ============================================================================
 # API ENDPOINTS
 # ============================================================================
 
-@app.post("/audio")
+@app.post("/audio", status_code=202)
 async def handle_audio_stream(
     request: Request,
-    sample_rate: int = Query(..., description="Audio sample rate in Hz"),
+    background: BackgroundTasks,
+    sample_rate: int = Query(..., gt=0, le=192000, description="Audio sample rate in Hz"),
     uid: str = Query(..., description="User ID"),
     analyze_emotion: bool = Query(True, description="Whether to analyze emotions with Hume AI"),
     send_notification: Optional[bool] = Query(None, description="Override notification setting (uses config default if not specified)"),
@@ -92,6 +141,10 @@ async def handle_audio_stream(
     """
     Endpoint to receive audio bytes from Omi device and analyze with Hume AI.
 
+    Responds 202 Accepted as soon as the audio is read. Saving, Hume analysis
+    and notifications run in the background; poll GET /audio/{filename} for
+    the results.
+
     Query Parameters:
         - sample_rate: Audio sample rate (e.g., 8000 or 16000)
         - uid: User unique ID
@@ -123,134 +176,81 @@ async def handle_audio_stream(
         audio_stats["last_uid"] = uid
 
         # Read audio bytes from request body
-        audio_data = await request.body()
+        try:
+            audio_data = await read_body_preallocated(request)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=408, detail="Timed out reading audio data")
+        except AudioTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
 
         if not audio_data:
             raise HTTPException(status_code=400, detail="No audio data received")
 
-        print(f"Received {len(audio_data)} bytes of audio from user {uid} at {sample_rate}Hz")
+        logger.info(f"Received {len(audio_data)} bytes of audio from user {uid} at {sample_rate}Hz")
 
-        # Create temporary WAV file
+        # Local WAV copy, cleaned up after 5 minutes
         audio_dir = Path("audio_files")
         audio_dir.mkdir(exist_ok=True)
 
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
-        filename = f"{uid}_{timestamp}.wav"
+        # Nanosecond timestamp plus a random suffix keeps names unique without strftime
+        timestamp_ns = time.time_ns()
+        filename = f"{uid}_{timestamp_ns}_{secrets.token_hex(3)}.wav"
         local_file_path = audio_dir / filename
 
-        # Write WAV file with header
-        wav_header = create_wav_header(sample_rate, len(audio_data))
-        with open(local_file_path, 'wb') as f:
-            f.write(wav_header)
-            f.write(audio_data)
-
-        print(f"Saved audio file: {local_file_path}")
-
-        # Analyze with Hume AI if requested
-        hume_results = None
-        if analyze_emotion:
-            hume_api_key = os.getenv('HUME_API_KEY')
-            if not hume_api_key:
-                print("Warning: HUME_API_KEY not set, skipping emotion analysis")
-            else:
-                print(f"Analyzing audio with Hume AI...")
-                hume_results = await analyze_audio_with_hume(str(local_file_path))
-
-                if hume_results.get("success"):
-                    audio_stats["successful_analyses"] += 1
-
-                    predictions = hume_results.get("predictions", [])
-                    all_top_emotions = []
-
-                    for pred in predictions:
-                        top_3 = pred.get("top_3_emotions", [])
-                        all_top_emotions.extend(top_3)
-
-                        for emotion in top_3:
-                            emotion_name = emotion.get("name")
-                            if emotion_name:
-                                audio_stats["emotion_counts"][emotion_name] = \
-                                    audio_stats["emotion_counts"].get(emotion_name, 0) + 1
-
-                    if all_top_emotions:
-                        audio_stats["recent_emotions"] = all_top_emotions[:10]
-                        update_rizz_score(all_top_emotions)
-
-                    # Check if should send notification
-                    should_notify = send_notification if send_notification is not None else EMOTION_CONFIG.get("notification_enabled", True)
-                    has_predictions = len(predictions) > 0
-
-                    print(f"🔔 Notification check: should_notify={should_notify}, has_predictions={has_predictions}")
-
-                    if should_notify and has_predictions:
-                        import json
-
-                        # Use custom filters if provided, otherwise use config
-                        if emotion_filters:
-                            try:
-                                custom_filters = json.loads(emotion_filters)
-                                print(f"Using custom emotion filters: {custom_filters}")
-                            except json.JSONDecodeError:
-                                print(f"Warning: Invalid emotion_filters JSON, using config default")
-                                custom_filters = EMOTION_CONFIG.get("emotion_thresholds", {})
-                        else:
-                            custom_filters = EMOTION_CONFIG.get("emotion_thresholds", {})
-                            print(f"Using config emotion filters: {custom_filters}")
-
-                        # Check trigger conditions
-                        trigger_result = check_emotion_triggers(predictions, custom_filters)
-                        print(f"📊 Trigger check result: triggered={trigger_result['triggered']}, count={trigger_result['count']}")
-
-                        if trigger_result["triggered"]:
-                            triggered_emotions = trigger_result["emotions"]
-                            emotion_names = [e["name"] for e in triggered_emotions[:3]]
-
-                            # Check cooldown before sending notification
-                            if can_send_notification():
-                                message = get_rizz_notification_message(audio_stats["rizz_score"], triggered_emotions)
-
-                                notification_result = await send_omi_notification(uid, message)
-
-                                if notification_result.get("success"):
-                                    update_notification_time()
-                                    audio_stats["recent_notifications"].append({
-                                        "uid": uid,
-                                        "emotions": emotion_names,
-                                        "timestamp": datetime.utcnow().isoformat()
-                                    })
-                                    audio_stats["recent_notifications"] = audio_stats["recent_notifications"][-10:]
-                            else:
-                                print(f"⏳ Notification cooldown active. Skipping notification.")
-
-                else:
-                    audio_stats["failed_analyses"] += 1
-
-        response_data = {
-            "message": "Audio processed successfully",
-            "filename": filename,
-            "uid": uid,
-            "sample_rate": sample_rate,
-            "data_size_bytes": len(audio_data),
-            "timestamp": timestamp,
-            "local_file_path": str(local_file_path.absolute())
-        }
-
-        # Add Hume results if available
-        if hume_results:
-            response_data["hume_analysis"] = hume_results
+        # Analysis runs after the response is sent, poll GET /audio/{filename} for results
+        record_audio_job(filename, {"status": "processing", "filename": filename, "uid": uid})
+        background.add_task(
+            process_audio_analysis,
+            filename=filename,
+            local_file_path=local_file_path,
+            audio_data=audio_data,
+            sample_rate=sample_rate,
+            uid=uid,
+            analyze_emotion=analyze_emotion,
+            send_notification=send_notification,
+            emotion_filters=emotion_filters
+        )
 
-        return JSONResponse(
-            status_code=200,
-            content=response_data
+        return ORJSONResponse(
+            status_code=202,
+            content={
+                "status": "accepted",
+                "message": "Audio accepted for processing",
+                "filename": filename,
+                "uid": uid,
+                "sample_rate": sample_rate,
+                "data_size_bytes": len(audio_data),
+                # Milliseconds fit in a 53-bit float, so JavaScript and Dart clients read it exactly
+                "timestamp": timestamp_ns // 1_000_000
+            }
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Error processing audio: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error processing audio: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@app.get("/audio/{filename}")
+async def get_audio_result(filename: str):
+    """
+    Get the processing status and Hume AI results for an uploaded audio file.
+
+    Path Parameters:
+        - filename: The filename returned by POST /audio
+    """
+    job = audio_jobs.get(filename)
+
+    if job is None:
+        job = await asyncio.to_thread(load_audio_result, Path("audio_files"), filename)
+
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No results for {filename}")
+
+    return ORJSONResponse(content=job)
+
+
 @app.get("/", response_class=HTMLResponse)
 async def root(request: Request):
     """Root endpoint with web interface"""
@@ -300,7 +300,7 @@ async def get_status():
     hume_configured = bool(os.getenv('HUME_API_KEY'))
     omi_configured = bool(os.getenv('OMI_APP_ID') and os.getenv('OMI_API_KEY'))
 
-    return JSONResponse({
+    return {
         "status": "online",
         "service": "omi-audio-streaming",
         "configuration": {
@@ -308,7 +308,7 @@ async def get_status():
             "omi_integration": omi_configured
         },
         "stats": audio_stats
-    })
+    }
 
 
 @app.post("/analyze-text")
@@ -350,9 +350,9 @@ async def analyze_text_emotion(
                 detail=f"Text too long ({len(text)} characters). Maximum is 10,000 characters."
             )
 
-        print(f"Analyzing text emotion for user: {uid or 'anonymous'}")
-        print(f"Text length: {len(text)} characters")
-        print(f"Text preview: {text[:100]}...")
+        logger.info(f"Analyzing text emotion for user: {uid or 'anonymous'}")
+        logger.info(f"Text length: {len(text)} characters")
+        logger.info(f"Text preview: {text[:100]}...")
 
         # Analyze text with Hume AI
         hume_results = await analyze_text_with_hume(text)
@@ -365,26 +365,21 @@ async def analyze_text_emotion(
             "metadata": metadata
         }
 
-        return JSONResponse(
-            status_code=200,
-            content=response_data
-        )
+        return response_data
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error analyzing text: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error analyzing text: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
 @app.get("/emotion-config")
 async def get_emotion_config():
     """Get current emotion notification configuration"""
-    return JSONResponse({
+    return {
         "current_config": EMOTION_CONFIG
-    })
+    }
 
 
 @app.post("/emotion-config")
@@ -410,7 +405,7 @@ async def update_emotion_config(request: Request):
     """
     # Check if running in single-worker mode
     if os.getenv('RENDER') or os.getenv('RAILWAY') or os.getenv('FLY_APP_NAME'):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "error": "Runtime configuration updates are disabled in cloud deployments",
@@ -450,7 +445,7 @@ async def update_emotion_config(request: Request):
         with open(config_file, 'w') as f:
             json.dump(EMOTION_CONFIG, f, indent=2)
 
-        print(f"✓ Updated emotion config (local): {EMOTION_CONFIG}")
+        logger.info(f"✓ Updated emotion config (local): {EMOTION_CONFIG}")
 
         return {
             "message": "Configuration updated successfully (local development only)",
@@ -461,7 +456,7 @@ async def update_emotion_config(request: Request):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error updating config: {e}")
+        logger.error(f"Error updating config: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -483,15 +478,16 @@ async def reset_stats(request: Request):
         audio_stats["emotion_counts"] = {}
         audio_stats["rizz_score"] = 75
         audio_stats["recent_notifications"] = []
+        audio_stats["hume_wait_seconds"] = 0.0
 
-        print("✓ Statistics reset")
+        logger.info("✓ Statistics reset")
 
         return {"message": "Statistics reset successfully"}
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error resetting stats: {e}")
+        logger.error(f"Error resetting stats: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -506,7 +502,7 @@ async def manual_save_emotion_memory(uid: Optional[str] = Query(None, descriptio
     result = await save_emotion_memory(uid)
 
     if result.get("success"):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "message": "Emotion memory saved successfully",
@@ -514,7 +510,7 @@ async def manual_save_emotion_memory(uid: Optional[str] = Query(None, descriptio
             }
         )
     else:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "message": "Failed to save emotion memory",
@@ -534,7 +530,7 @@ async def force_send_notification_endpoint(uid: Optional[str] = Query(None, desc
     target_uid = uid or audio_stats.get("last_uid")
 
     if not target_uid:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "message": "No user ID available. Please provide a UID or speak into your Omi device first.",
@@ -546,7 +542,7 @@ async def force_send_notification_endpoint(uid: Optional[str] = Query(None, desc
     recent_emotions = audio_stats.get("recent_emotions", [])[:3]
 
     if not recent_emotions:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "message": "No recent emotions detected. Please speak into your Omi device first.",
@@ -574,7 +570,7 @@ async def force_send_notification_endpoint(uid: Optional[str] = Query(None, desc
         })
         audio_stats["recent_notifications"] = audio_stats["recent_notifications"][-10:]
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "message": "Notification sent successfully",
@@ -585,7 +581,7 @@ async def force_send_notification_endpoint(uid: Optional[str] = Query(None, desc
             }
         )
     else:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "message": "Failed to send notification",
@@ -606,5 +602,15 @@ async def health_check():
 # ============================================================================
 
 if __name__ == "__main__":
-    # Run the server
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # Stats and runtime config live in process memory, so default to one worker
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+    # Run the server. The default "auto" loop and http settings pick uvloop and
+    # httptools when uvicorn[standard] installed them and fall back otherwise.
+    uvicorn.run(
+        app if workers == 1 else "main:app",
+        host="0.0.0.0",
+        port=8080,
+        workers=workers,
+        backlog=2048
+    )
@@ -1,5 +1,6 @@
 """Test script to verify audio chunking works"""
 import asyncio
+import wave
 from app import analyze_audio_with_hume
 import sys
 
@@ -8,7 +9,16 @@ async def test_audio_file(file_path):
     print(f"Testing: {file_path}")
     print(f"{'='*60}\n")
 
-    result = await analyze_audio_with_hume(file_path)
+    with wave.open(file_path, 'rb') as wav_file:
+        # analyze_audio_with_hume takes raw mono 16-bit PCM, other layouts would be misread
+        if wav_file.getnchannels() != 1 or wav_file.getsampwidth() != 2:
+            print(f"Unsupported WAV: {wav_file.getnchannels()} channel(s), "
+                  f"{wav_file.getsampwidth() * 8}-bit. Expected mono 16-bit PCM.")
+            return None
+        sample_rate = wav_file.getframerate()
+        audio_data = wav_file.readframes(wav_file.getnframes())
+
+    result = await analyze_audio_with_hume(audio_data, sample_rate)
 
     print(f"\n{'='*60}")
     print("RESULT:")
@@ -51,4 +61,5 @@ if __name__ == "__main__":
             sys.exit(1)
         file_path = files[-1]
 
-    asyncio.run(test_audio_file(file_path))
+    if asyncio.run(test_audio_file(file_path)) is None:
+        sys.exit(1)
@@ -0,0 +1,29 @@
+"""Test the NumPy peak scan used to skip Hume analysis for silent clips"""
+import numpy as np
+from app import audio_peak_abs, is_silent
+
+
+def pcm(*samples):
+    return np.array(samples, dtype='<i2').tobytes()
+
+
+def test_audio_peak_abs():
+    assert audio_peak_abs(b"") == 0
+    assert audio_peak_abs(pcm(0, 0, 0)) == 0
+    assert audio_peak_abs(pcm(10, -300, 200)) == 300
+    # np.abs(-32768) wraps to -32768 in int16, the peak must still be 32768
+    assert audio_peak_abs(pcm(0, -32768, 5)) == 32768
+    # A trailing odd byte is ignored
+    assert audio_peak_abs(pcm(7) + b"\xff") == 7
+
+
+def test_is_silent():
+    assert is_silent(pcm(0, 1, -1), threshold=2)
+    assert not is_silent(pcm(0, 2, -1), threshold=2)
+    assert not is_silent(pcm(-32768), threshold=2)
+
+
+if __name__ == "__main__":
+    test_audio_peak_abs()
+    test_is_silent()
+    print("✓ Silence detection tests passed")
@@ -0,0 +1,39 @@
+"""Test the NumPy stereo interleaver and the stereo WAV header"""
+import struct
+
+import numpy as np
+import pytest
+from app import create_wav_header, interleave_i16
+
+
+def pcm(*samples):
+    return np.array(samples, dtype='<i2').tobytes()
+
+
+def test_interleave_i16():
+    assert interleave_i16(pcm(1, 2, 3), pcm(-1, -2, -3)) == pcm(1, -1, 2, -2, 3, -3)
+    assert interleave_i16(b"", b"") == b""
+
+    with pytest.raises(ValueError):
+        interleave_i16(pcm(1, 2), pcm(1))
+
+
+def test_stereo_wav_header():
+    header = create_wav_header(16000, 400, num_channels=2)
+    (riff_size, num_channels, sample_rate, byte_rate,
+     block_align, bits_per_sample, data_size) = struct.unpack('<4xI14xHIIHH4xI', header)
+
+    assert len(header) == 44
+    assert riff_size == 36 + 400
+    assert num_channels == 2
+    assert sample_rate == 16000
+    assert byte_rate == 16000 * 4
+    assert block_align == 4
+    assert bits_per_sample == 16
+    assert data_size == 400
+
+
+if __name__ == "__main__":
+    test_interleave_i16()
+    test_stereo_wav_header()
+    print("✓ Stereo tests passed")